@@ -4,6 +4,7 @@ from scripts.config_manager import load_config, save_config
 from scripts.phone_connection import connect_wirelessly
 from scripts.live_view import start_live_view
 from scripts.photo_processing import process_phone
+from scripts.upload_queue import UploadQueue
 from scripts.utils import ensure_dir, info
 
 # --- App state/config ---
@@ -11,10 +12,17 @@ cfg = load_config()
 SAVE_DIR = cfg["save_dir"]
 ensure_dir(SAVE_DIR)
 
+uploads = UploadQueue(
+    cfg["upload_target"],
+    workers=cfg["upload_workers"],
+    limit_kbps=cfg["upload_limit_kbps"],
+)
+uploads.start()
+
 # --- GUI ---
 root = tk.Tk()
 root.title("Samsung Scanner Tool")
-root.geometry("250x250")
+root.geometry("250x280")
 root.attributes("-topmost", True)
 
 def set_save_folder():
@@ -30,7 +38,7 @@ def set_save_folder():
 
 # Buttons (only four)
 btns = [
-    ("📷 Process Photos", lambda: process_phone(SAVE_DIR, delete_after=True)),
+    ("📷 Process Photos", lambda: process_phone(SAVE_DIR, delete_after=True, on_saved=uploads.enqueue)),
     ("📶 Connect Wirelessly", connect_wirelessly),
     ("👁️ Live View", start_live_view),
     ("📂 Set Save Folder", set_save_folder),
@@ -40,4 +48,24 @@ wrap = tk.Frame(root); wrap.pack(expand=True, pady=12)
 for text, fn in btns:
     tk.Button(wrap, text=text, command=fn, width=26, height=2).pack(pady=6)
 
+# Upload status line
+status = tk.Label(root, text="", anchor="w", fg="#555")
+status.pack(side="bottom", fill="x", padx=8, pady=(0, 6))
+
+def refresh_status():
+    if not cfg["upload_target"]:
+        text = "⬆ Upload off"
+    else:
+        text = f"⬆ Queue: {uploads.depth()}  |  {uploads.rate_mbps():.1f} MB/s"
+    if uploads.failed():
+        text += f"  |  {uploads.failed()} failed"
+    status.config(text=text)
+    root.after(1000, refresh_status)
+
+def on_close():
+    uploads.stop()
+    root.destroy()
+
+refresh_status()
+root.protocol("WM_DELETE_WINDOW", on_close)
 root.mainloop()
\ No newline at end of file
@@ -3,11 +3,13 @@ from .utils import ensure_dir, base_dir
 
 CONFIG_PATH = os.path.join(base_dir(), "config.json")
 DEFAULT_SAVE_DIR = os.path.join(base_dir(), "captures")
+# Archive upload: "" = off, else a share/folder path or http(s) URL
+UPLOAD_DEFAULTS = {"upload_target": "", "upload_workers": 2, "upload_limit_kbps": 0}
 
 def load_config():
     # Create default if missing
     if not os.path.exists(CONFIG_PATH):
-        cfg = {"save_dir": DEFAULT_SAVE_DIR}
+        cfg = {"save_dir": DEFAULT_SAVE_DIR, **UPLOAD_DEFAULTS}
         save_config(cfg)
         ensure_dir(DEFAULT_SAVE_DIR)
         return cfg
@@ -18,6 +20,8 @@ def load_config():
     save_dir = cfg.get("save_dir") or DEFAULT_SAVE_DIR
     ensure_dir(save_dir)
     cfg["save_dir"] = save_dir
+    for key, val in UPLOAD_DEFAULTS.items():
+        cfg.setdefault(key, val)
     return cfg
 
 def save_config(cfg: dict):
@@ -2,4 +2,5 @@ from scripts.config_manager import load_config, save_config
 from scripts.phone_connection import connect_wirelessly
 from scripts.live_view import start_live_view
 from scripts.photo_processing import process_phone
+from scripts.upload_queue import UploadQueue
 from scripts.utils import ensure_dir, info
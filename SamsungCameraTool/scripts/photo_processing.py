@@ -118,6 +118,7 @@ def process_phone(
         delete_after: bool = True,
         on_view=None,
         tk_parent: tk.Misc | None = None,
+        on_saved=None,
 ) -> None:
     while True:  # Loop until we have a final tag or cancel
         tag = prompt_asset_tag()
@@ -200,6 +201,10 @@ def process_phone(
         pull_device_file(fn, dest)
         pulled += 1
 
+    # Hand the finished folder off (e.g. to the archive upload queue)
+    if callable(on_saved):
+        on_saved(dest)
+
     if delete_after:
         err = delete_all_on_device()
         if err:
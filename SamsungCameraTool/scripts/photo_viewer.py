@@ -5,6 +5,7 @@ import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageTk
 
+from .thumbnail_grid import ThumbnailGrid
 from .utils import (
     ensure_dir,
     list_device_photos,
@@ -42,6 +43,7 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
     local_paths: list[str] = []      # matching local temp copies
     idx = 0
     selected: set[int] = set()
+    grid: ThumbnailGrid | None = None   # set while in grid mode
 
     def pull_latest():
         nonlocal remote_names, local_paths, idx, selected
@@ -49,6 +51,8 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
         remote_names = list_device_photos() or []
         local_paths = []
         if not remote_names:
+            idx = 0
+            show_current()  # clear the panel / grid from the previous pull
             messagebox.showinfo("Photos", "No photos found on the phone.")
             return
         for name in remote_names:
@@ -59,6 +63,11 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
         show_current()
 
     def show_current():
+        if grid is not None:
+            grid.refresh()
+            grid.set_current(idx)  # keep both modes on the same photo
+            show_grid_status()
+            return
         if not local_paths:
             panel.config(image="", text="No images", compound="center")
             label.configure(text="")
@@ -80,24 +89,72 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
                  f"{'[SELECTED]' if i in selected else ''}"
         )
 
+    def show_grid_status():
+        label.configure(text=f"{len(local_paths)} photo(s)  {len(selected)} selected  "
+                             "(click = select, Shift+click = range, double-click = open)")
+
+    def sync_idx():
+        # in grid mode the last clicked cell is the current photo
+        nonlocal idx
+        if grid is not None:
+            idx = grid.current
+
+    def toggle_grid():
+        nonlocal grid, idx
+        if grid is None:
+            panel.pack_forget()
+            grid = ThumbnailGrid(view, lambda: local_paths, selected,
+                                 on_change=show_grid_status, on_open=open_from_grid)
+            grid.pack(fill="both", expand=True)
+            grid_btn.config(text="▢ Single")
+            grid.current = idx
+            grid.update_selection()
+            # wait for layout so see() knows the viewport height
+            win.after_idle(lambda: grid and grid.see(grid.current))
+            show_grid_status()
+        else:
+            idx = grid.current
+            grid.destroy()
+            grid = None
+            panel.pack(fill="both", expand=True)
+            grid_btn.config(text="▦ Grid")
+            show_current()
+
+    def open_from_grid(i: int):
+        grid.current = i
+        toggle_grid()
+
     def prev_img():
         nonlocal idx
         if not local_paths: return
+        sync_idx()
         idx = (idx - 1) % len(local_paths)
+        if grid is not None:
+            grid.set_current(idx)
+            return
         show_current()
 
     def next_img():
         nonlocal idx
         if not local_paths: return
+        sync_idx()
         idx = (idx + 1) % len(local_paths)
+        if grid is not None:
+            grid.set_current(idx)
+            return
         show_current()
 
     def toggle_select():
         if not local_paths: return
+        sync_idx()
         if idx in selected:
             selected.remove(idx)
         else:
             selected.add(idx)
+        if grid is not None:
+            grid.update_selection()
+            show_grid_status()
+            return
         show_current()
 
     def delete_selected():
@@ -131,6 +188,7 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
         selected.clear()
         # fix idx
         nonlocal idx
+        sync_idx()
         idx = min(idx, max(0, len(local_paths)-1))
         show_current()
         if errors:
@@ -143,8 +201,13 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
     win.title("Phone Photos")
     win.resizable(False, False)
 
-    panel = tk.Label(win, width=640, height=640, bg="#f4f4f4")
-    panel.pack(padx=8, pady=(8, 4))
+    # single image and grid swap inside this frame
+    view = tk.Frame(win, width=656, height=640)
+    view.pack(padx=8, pady=(8, 4))
+    view.pack_propagate(False)
+
+    panel = tk.Label(view, width=640, height=640, bg="#f4f4f4")
+    panel.pack(fill="both", expand=True)
 
     label = tk.Label(win, text="", anchor="w")
     label.pack(padx=8, pady=(0, 6), fill="x")
@@ -157,7 +220,9 @@ def view_phone_photos(parent: tk.Tk | tk.Toplevel | None = None, temp_dir: str |
     tk.Button(row, text="✅ Select / Unselect", width=18, command=toggle_select).grid(row=0, column=2, padx=6)
     tk.Button(row, text="🗑 Delete Selected (phone)", width=22, command=delete_selected).grid(row=0, column=3, padx=6)
     tk.Button(row, text="↻ Refresh", width=10, command=pull_latest).grid(row=0, column=4, padx=3)
-    tk.Button(row, text="Close", width=10, command=win.destroy).grid(row=0, column=5, padx=3)
+    grid_btn = tk.Button(row, text="▦ Grid", width=10, command=toggle_grid)
+    grid_btn.grid(row=0, column=5, padx=3)
+    tk.Button(row, text="Close", width=10, command=win.destroy).grid(row=0, column=6, padx=3)
 
     # initial load
     pull_latest()
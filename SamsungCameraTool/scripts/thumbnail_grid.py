@@ -0,0 +1,262 @@
+# scripts/thumbnail_grid.py
+# Contact-sheet view for the phone photo viewer.
+import os
+import queue
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageTk
+
+CELL = 128             # grid pitch
+GAP = 2                # space around each cell inside its pitch
+HIGHLIGHT = 3          # selection border width
+CAPTION_H = 14         # one line of the 7pt filename caption
+# the thumbnail and its caption must both fit inside the cell's label
+THUMB = CELL - 2 * GAP - 2 * HIGHLIGHT - CAPTION_H
+COLUMNS = 5            # 5 * 128 = 640, same footprint as the single view
+OVERSCAN = 2           # extra rows built above/below the viewport
+CACHE_SIZE = 300       # decoded thumbnails kept in memory (PIL, not Tk)
+POLL_MS = 30           # how often decoded results are handed to Tk
+
+SEL_COLOR = "#2f7de1"
+CELL_BG = "#e6e6e6"
+CURRENT_BG = "#ffd866"  # the photo Prev/Next and Select / Unselect act on
+
+def _decode_thumb(path: str) -> Image.Image:
+    """Runs in the worker pool. Only PIL here, Tk objects must stay on the main thread."""
+    with Image.open(path) as img:
+        # JPEG can downscale while decoding, which is most of the win on phone photos
+        img.draft("RGB", (THUMB * 2, THUMB * 2))
+        img = img.convert("RGB")
+    img.thumbnail((THUMB, THUMB), Image.Resampling.LANCZOS)
+    return img
+
+class ThumbnailGrid(tk.Frame):
+    """
+    Scrollable grid of thumbnails that only builds widgets for the rows on screen.
+
+    get_paths: returns the current list of local image paths (indices match the viewer)
+    selected:  the viewer's selection set, mutated in place
+    on_change: called after the selection changes
+    on_open:   called with an index on double-click
+    """
+
+    def __init__(self, master, get_paths, selected: set[int], on_change=None, on_open=None):
+        super().__init__(master)
+        self._get_paths = get_paths
+        self._selected = selected
+        self._on_change = on_change
+        self._on_open = on_open
+
+        self._cells: dict[int, dict] = {}             # idx -> {"item", "label", "path", "future", "photo"}
+        self._cache: OrderedDict[str, Image.Image] = OrderedDict()
+        self._results: queue.Queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        self._gen = 0                                  # bumped on refresh so stale decodes are dropped
+        self._anchor: int | None = None
+        self.current = 0                               # index Prev/Next/Select act on
+        self._render_pending = False
+        self._poll_id = None
+
+        self.canvas = tk.Canvas(
+            self, width=COLUMNS * CELL, height=640, bg="#f4f4f4",
+            highlightthickness=0, yscrollincrement=CELL // 4,
+        )
+        self.scroll = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scroll.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", lambda e: self._schedule_render())
+        self._bind_wheel(self.canvas)
+
+        self._poll_id = self.after(POLL_MS, self._poll)
+        self.refresh()
+
+    # --- public ---
+
+    def refresh(self):
+        """Rebuild after the path list changed (pull, delete). Cached thumbnails are kept by path."""
+        self._gen += 1
+        for idx in list(self._cells):
+            self._drop_cell(idx)
+        n = len(self._get_paths())
+        rows = (n + COLUMNS - 1) // COLUMNS
+        self.canvas.configure(scrollregion=(0, 0, COLUMNS * CELL, max(rows * CELL, 1)))
+        if not self._selected or (self._anchor is not None and self._anchor >= n):
+            self._anchor = None
+        self.current = max(0, min(self.current, n - 1))
+        self._schedule_render()
+
+    def update_selection(self):
+        for idx, cell in self._cells.items():
+            self._paint(idx, cell)
+
+    def set_current(self, idx: int):
+        self.current = idx
+        self.update_selection()
+        self.see(idx)
+
+    def see(self, idx: int):
+        n = len(self._get_paths())
+        rows = (n + COLUMNS - 1) // COLUMNS
+        if not rows:
+            return
+        row = idx // COLUMNS
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            height = self.canvas.winfo_reqheight()  # not laid out yet
+        if row * CELL < top:
+            self.canvas.yview_moveto(row / rows)
+        elif (row + 1) * CELL > top + height:
+            self.canvas.yview_moveto(max(0, (row + 1) * CELL - height) / (rows * CELL))
+
+    def destroy(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._cells.clear()
+        self._cache.clear()
+        super().destroy()
+
+    # --- scrolling / virtualization ---
+
+    def _bind_wheel(self, w):
+        w.bind("<MouseWheel>", self._on_wheel)                              # Windows / macOS
+        w.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-3, "units"))  # X11
+        w.bind("<Button-5>", lambda e: self.canvas.yview_scroll(3, "units"))
+
+    def _on_wheel(self, event):
+        steps = -int(event.delta / 120) * 3 if abs(event.delta) >= 120 else -event.delta
+        self.canvas.yview_scroll(steps, "units")
+
+    def _on_scroll(self, first, last):
+        self.scroll.set(first, last)
+        self._schedule_render()
+
+    def _schedule_render(self):
+        # Coalesce bursts of scroll events into one layout pass
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        self._render_pending = False
+        paths = self._get_paths()
+        n = len(paths)
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), CELL)
+        first_row = max(0, int(top // CELL) - OVERSCAN)
+        last_row = int((top + height) // CELL) + OVERSCAN
+        wanted = range(first_row * COLUMNS, min(n, (last_row + 1) * COLUMNS))
+
+        for idx in [i for i in self._cells if i not in wanted]:
+            self._drop_cell(idx)
+        for idx in wanted:
+            if idx not in self._cells:
+                self._make_cell(idx, paths[idx])
+
+    def _make_cell(self, idx: int, path: str):
+        label = tk.Label(
+            self.canvas, text=os.path.basename(path)[-16:], bg=CELL_BG,
+            font=("Segoe UI", 7), bd=0, padx=0, pady=0,
+            highlightthickness=HIGHLIGHT, highlightbackground=CELL_BG,
+        )
+        row, col = divmod(idx, COLUMNS)
+        item = self.canvas.create_window(
+            col * CELL + GAP, row * CELL + GAP, anchor="nw",
+            window=label, width=CELL - 2 * GAP, height=CELL - 2 * GAP,
+        )
+        cell = {"item": item, "label": label, "path": path, "future": None, "photo": None}
+        self._cells[idx] = cell
+
+        label.bind("<Button-1>", lambda e, i=idx: self._click(i, "toggle"))
+        label.bind("<Shift-Button-1>", lambda e, i=idx: self._click(i, "range"))
+        label.bind("<Double-Button-1>", lambda e, i=idx: self._open(i))
+        self._bind_wheel(label)
+        self._paint(idx, cell)
+
+        thumb = self._cache.get(path)
+        if thumb is not None:
+            self._cache.move_to_end(path)
+            self._set_photo(cell, thumb)
+        else:
+            gen = self._gen
+            fut = self._pool.submit(_decode_thumb, path)
+            fut.add_done_callback(lambda f, i=idx, p=path, g=gen: self._results.put((g, i, p, f)))
+            cell["future"] = fut
+
+    def _drop_cell(self, idx: int):
+        cell = self._cells.pop(idx)
+        if cell["future"] is not None:
+            cell["future"].cancel()
+        self.canvas.delete(cell["item"])
+        cell["label"].destroy()
+        cell["photo"] = None  # release the Tk image with the widget
+
+    def _poll(self):
+        # Hand finished decodes to Tk on the main thread
+        try:
+            while True:
+                gen, idx, path, fut = self._results.get_nowait()
+                if fut.cancelled() or fut.exception() is not None:
+                    cell = self._cells.get(idx)
+                    if gen == self._gen and cell and cell["path"] == path and not fut.cancelled():
+                        cell["label"].config(text="(failed to load)")
+                    continue
+                thumb = fut.result()
+                self._cache[path] = thumb
+                self._cache.move_to_end(path)
+                while len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+                cell = self._cells.get(idx)
+                if gen == self._gen and cell and cell["path"] == path:
+                    cell["future"] = None
+                    self._set_photo(cell, thumb)
+        except queue.Empty:
+            pass
+        self._poll_id = self.after(POLL_MS, self._poll)
+
+    def _set_photo(self, cell: dict, thumb: Image.Image):
+        photo = ImageTk.PhotoImage(thumb)
+        cell["photo"] = photo  # keep ref while the cell is alive
+        cell["label"].config(image=photo, compound="top")
+
+    # --- selection ---
+
+    def _paint(self, idx: int, cell: dict):
+        bg = CURRENT_BG if idx == self.current else CELL_BG
+        color = SEL_COLOR if idx in self._selected else bg
+        cell["label"].config(bg=bg, highlightbackground=color, highlightcolor=color)
+
+    def _click(self, idx: int, mode: str):
+        if idx >= len(self._get_paths()):
+            return "break"  # stale cell from before a refresh
+        self.current = idx
+        if mode == "range" and self._anchor is not None:
+            lo, hi = sorted((self._anchor, idx))
+            self._selected.update(range(lo, hi + 1))
+        else:
+            if idx in self._selected:
+                self._selected.remove(idx)
+            else:
+                self._selected.add(idx)
+            self._anchor = idx
+        self.update_selection()
+        if callable(self._on_change):
+            self._on_change()
+        return "break"
+
+    def _open(self, idx: int):
+        if idx >= len(self._get_paths()):
+            return "break"
+        # The first click of the double-click already toggled this cell; undo that
+        self._selected.symmetric_difference_update({idx})
+        self.update_selection()
+        if callable(self._on_change):
+            self._on_change()
+        if callable(self._on_open):
+            self._on_open(idx)
+        return "break"
@@ -0,0 +1,346 @@
+# scripts/upload_queue.py
+# Background shipping of finished tag folders to the central archive.
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from collections import deque
+
+from .utils import base_dir
+
+QUEUE_PATH = os.path.join(base_dir(), "upload_queue.json")
+
+BACKOFF_BASE = 2.0      # seconds, doubled per attempt
+BACKOFF_MAX = 300.0     # transient errors keep retrying at this interval
+RETRY_HTTP = {408, 429} # 4xx codes that are worth retrying
+RATE_WINDOW = 5.0       # seconds averaged for the MB/s readout
+HTTP_TIMEOUT = 60
+SLICE = 64 * 1024       # bytes charged to the rate limiter at a time
+
+class _SourceMissing(Exception):
+    """The saved tag folder is gone; retrying can't help."""
+
+class _Stopped(Exception):
+    """Raised inside a transfer when the queue is shutting down."""
+
+class _RateLimiter:
+    """Token bucket shared by all workers so the total stays under the cap."""
+
+    def __init__(self, bytes_per_sec: int):
+        self.rate = bytes_per_sec
+        self.tokens = float(bytes_per_sec)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self, n: int, stop: threading.Event):
+        if self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        # sleep outside the lock; callers queue up behind the debt they created
+        if delay and stop.wait(delay):
+            raise _Stopped()
+
+class _DirTarget:
+    """Mounted share / local folder. Chunks go to <name>.part, renamed when complete."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def put(self, src: str, remote: str, total: int, chunk: int, tick):
+        dest = os.path.join(self.root, *remote.split("/"))
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if os.path.exists(dest) and os.path.getsize(dest) == total:
+            return  # already shipped
+        part = dest + ".part"
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        if offset > total:
+            offset = 0
+        with open(src, "rb") as fin, open(part, "r+b" if offset else "wb") as fout:
+            fin.seek(offset)
+            fout.seek(offset)
+            fout.truncate()
+            while True:
+                data = fin.read(SLICE)
+                if not data:
+                    break
+                tick(len(data))
+                fout.write(data)
+        if os.path.getsize(part) != total:
+            raise IOError(f"size mismatch after copy: {remote}")
+        os.replace(part, dest)
+
+class _ThrottledReader:
+    """File-like PUT body: hands out at most `length` bytes, charging the limiter per slice."""
+
+    def __init__(self, f, length: int, tick):
+        self.f = f
+        self.left = length
+        self.tick = tick
+
+    def read(self, n: int = -1) -> bytes:
+        if self.left <= 0:
+            return b""
+        n = self.left if n is None or n < 0 else n
+        data = self.f.read(min(n, SLICE, self.left))
+        if not data:
+            raise IOError("source file shrank during upload")
+        self.tick(len(data))
+        self.left -= len(data)
+        return data
+
+class _HttpTarget:
+    """
+    HTTP endpoint. Per file:
+      HEAD <url>/<tag>/<file>  -> header Upload-Offset = bytes already stored (404 = none)
+      PUT  <url>/<tag>/<file>  with Upload-Offset / Upload-Length headers, body = one chunk
+    """
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+
+    def _remote_url(self, remote: str) -> str:
+        return f"{self.url}/{urllib.parse.quote(remote)}"
+
+    def _offset(self, url: str) -> int:
+        req = urllib.request.Request(url, method="HEAD")
+        try:
+            with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
+                return int(resp.headers.get("Upload-Offset") or 0)
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return 0
+            raise
+
+    def put(self, src: str, remote: str, total: int, chunk: int, tick):
+        url = self._remote_url(remote)
+        offset = self._offset(url)
+        if offset > total:
+            offset = 0
+        if offset == total and total:
+            return
+        with open(src, "rb") as fin:
+            fin.seek(offset)
+            while True:
+                # one PUT per chunk, streamed in rate-limited slices
+                n = min(chunk, total - offset)
+                body = _ThrottledReader(fin, n, tick)
+                req = urllib.request.Request(url, data=body, method="PUT", headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(n),
+                    "Upload-Offset": str(offset),
+                    "Upload-Length": str(total),
+                })
+                with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
+                    resp.read()
+                offset += n
+                if offset >= total:
+                    break  # an empty file gets one zero-length PUT
+
+def _make_target(target: str):
+    if target.lower().startswith(("http://", "https://")):
+        return _HttpTarget(target)
+    return _DirTarget(target)
+
+class UploadQueue:
+    """
+    Durable queue of tag folders to ship to the archive.
+
+    target:     folder/share path or http(s) URL ("" = uploads off, enqueue does nothing)
+    workers:    number of folders uploaded at the same time
+    limit_kbps: total bandwidth cap for all workers, 0 = unlimited
+    chunk_kb:   HTTP PUT size, i.e. the resume granularity (the cap is applied per 64 KB)
+    """
+
+    def __init__(self, target: str, workers: int = 2, limit_kbps: int = 0,
+                 chunk_kb: int = 1024, path: str = QUEUE_PATH):
+        self.target = target
+        self.workers = max(1, int(workers))
+        self.chunk = max(64, int(chunk_kb)) * 1024
+        self.path = path
+
+        self._limiter = _RateLimiter(int(limit_kbps) * 1024)
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._active: set[str] = set()      # job ids currently being uploaded
+        self._sent = deque()                # (time, bytes) for the MB/s readout
+        self._jobs: list[dict] = self._load()
+
+    # --- persistence ---
+
+    def _load(self) -> list[dict]:
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                jobs = json.load(f)
+        except (OSError, ValueError):
+            return []
+        # fresh start for anything parked as failed last session
+        for job in jobs:
+            if job.get("status") == "failed":
+                job.update(status="pending", attempts=0, next_try=0)
+        return jobs
+
+    def _save(self):
+        # caller holds self._cond
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._jobs, f, indent=2)
+        os.replace(tmp, self.path)
+
+    # --- public ---
+
+    def start(self):
+        if not self.target or self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"upload-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: float = 2.0):
+        """Stop workers. Partial files stay on the target and resume next start."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def enqueue(self, folder: str, tag: str | None = None) -> None:
+        """Queue a saved tag folder. Re-queuing a folder already waiting just refreshes it."""
+        if not self.target:
+            return
+        folder = os.path.abspath(folder)
+        tag = tag or os.path.basename(folder.rstrip("\\/"))
+        with self._cond:
+            for job in self._jobs:
+                if job["folder"] == folder:
+                    # new photos may have been added; shipped files are skipped via "done"
+                    job.update(status="pending", attempts=0, next_try=0, error="")
+                    if job["id"] in self._active:
+                        job["requeue"] = True  # walk the folder again once this pass ends
+                    break
+            else:
+                self._jobs.append({
+                    "id": uuid.uuid4().hex, "folder": folder, "tag": tag,
+                    "status": "pending", "attempts": 0, "next_try": 0, "done": [], "error": "",
+                })
+            self._save()
+            self._cond.notify()
+
+    def depth(self) -> int:
+        """Folders waiting or in flight (failed ones not counted)."""
+        with self._cond:
+            return sum(1 for j in self._jobs if j["status"] == "pending")
+
+    def failed(self) -> int:
+        with self._cond:
+            return sum(1 for j in self._jobs if j["status"] == "failed")
+
+    def rate_mbps(self) -> float:
+        now = time.monotonic()
+        with self._cond:
+            while self._sent and now - self._sent[0][0] > RATE_WINDOW:
+                self._sent.popleft()
+            total = sum(n for _, n in self._sent)
+        return total / RATE_WINDOW / (1024 * 1024)
+
+    # --- workers ---
+
+    def _claim(self) -> dict | None:
+        with self._cond:
+            while not self._stop.is_set():
+                now = time.time()
+                wake = None
+                for job in self._jobs:
+                    if job["status"] != "pending" or job["id"] in self._active:
+                        continue
+                    if job["next_try"] <= now:
+                        self._active.add(job["id"])
+                        return job
+                    wake = min(wake or job["next_try"], job["next_try"])
+                self._cond.wait(None if wake is None else max(0.1, wake - now))
+        return None
+
+    def _tick(self, n: int):
+        if self._stop.is_set():
+            raise _Stopped()
+        self._limiter.wait(n, self._stop)
+        with self._cond:
+            self._sent.append((time.monotonic(), n))
+
+    def _run(self, job: dict):
+        target = _make_target(self.target)
+        if not os.path.isdir(job["folder"]):
+            raise _SourceMissing(job["folder"])
+        files = []
+        for dirpath, _, names in os.walk(job["folder"]):
+            for name in names:
+                full = os.path.join(dirpath, name)
+                files.append((os.path.relpath(full, job["folder"]).replace(os.sep, "/"), full))
+        for rel, full in sorted(files):
+            if rel in job["done"]:
+                continue
+            target.put(full, f"{job['tag']}/{rel}", os.path.getsize(full), self.chunk, self._tick)
+            with self._cond:
+                job["done"].append(rel)
+                self._save()
+
+    def _worker(self):
+        while not self._stop.is_set():
+            job = self._claim()
+            if job is None:
+                return
+            try:
+                self._run(job)
+            except _Stopped:
+                pass  # left pending; resumes next start
+            except _SourceMissing as e:
+                self._park(job, f"folder missing: {e}")
+            except urllib.error.HTTPError as e:
+                # 4xx means the server rejected the request itself; 5xx is the server's problem
+                if 400 <= e.code < 500 and e.code not in RETRY_HTTP:
+                    self._park(job, f"HTTP {e.code}: {e.reason}")
+                else:
+                    self._retry_later(job, e)
+            except Exception as e:  # target offline, network down, file vanished... retry
+                self._retry_later(job, e)
+            else:
+                with self._cond:
+                    if job.pop("requeue", False):
+                        job["next_try"] = 0
+                    else:
+                        self._jobs.remove(job)
+                    self._save()
+            finally:
+                with self._cond:
+                    self._active.discard(job["id"])
+                    self._cond.notify_all()
+
+    def _retry_later(self, job: dict, err: Exception):
+        with self._cond:
+            job["attempts"] += 1
+            job["error"] = str(err)
+            # never give up on a transient error; a long outage just settles at BACKOFF_MAX
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** min(job["attempts"] - 1, 16))
+            job["next_try"] = time.time() + delay * random.uniform(0.8, 1.2)
+            self._save()
+
+    def _park(self, job: dict, msg: str):
+        with self._cond:
+            job["status"] = "failed"
+            job["error"] = msg
+            self._save()